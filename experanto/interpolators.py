@@ -7,6 +7,7 @@ import re
 import typing
 import warnings
 from abc import abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Union, cast
 
@@ -21,6 +22,32 @@ from .intervals import TimeInterval
 
 logger = logging.getLogger(__name__)
 
+# libyaml-backed loader when PyYAML was built with it, pure Python fallback otherwise
+_YamlSafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+# Returns on the first time point inside [start, end], without building a mask.
+@njit(cache=True)
+def _any_in_interval(times, start, end):
+    for i in range(times.shape[0]):
+        if start <= times[i] <= end:
+            return True
+    return False
+
+
+# Whether x is (strictly) increasing, stopping at the first violation or NaN.
+# Interpolator._select_valid uses it to detect sorted queries it can slice, and
+# ScreenInterpolator to check query order, without np.diff temporaries.
+@njit(cache=True)
+def _is_increasing(x, strict):
+    for i in range(1, x.shape[0]):
+        if strict:
+            if not x[i] > x[i - 1]:
+                return False
+        elif not x[i] >= x[i - 1]:
+            return False
+    return True
+
 
 class Interpolator:
     """Abstract base class for time series interpolation.
@@ -63,11 +90,14 @@ class Interpolator:
         self.end_time = None
         # Valid interval can be different to start time and end time.
         self.valid_interval = None
+        self._meta = None
 
     def load_meta(self):
-        with open(self.root_folder / "meta.yml") as f:
-            meta = yaml.safe_load(f)
-        return meta
+        # parsed once per interpolator, subclasses can call this freely
+        if self._meta is None:
+            with open(self.root_folder / "meta.yml") as f:
+                self._meta = yaml.load(f, Loader=_YamlSafeLoader)
+        return self._meta
 
     @abstractmethod
     def interpolate(
@@ -77,7 +107,13 @@ class Interpolator:
         ...
 
     def __contains__(self, times: np.ndarray):
-        return np.any(self.valid_times(times))
+        assert self.valid_interval is not None
+        times = np.asarray(times, dtype=np.float64).ravel()
+        return bool(
+            _any_in_interval(
+                times, float(self.valid_interval.start), float(self.valid_interval.end)
+            )
+        )
 
     def __enter__(self):
         return self
@@ -112,7 +148,7 @@ class Interpolator:
             If the modality type is not supported.
         """
         with open(Path(root_folder) / "meta.yml", "r") as file:
-            meta_data = yaml.safe_load(file)
+            meta_data = yaml.load(file, Loader=_YamlSafeLoader)
         modality = meta_data.get("modality")
 
         if modality == "sequence":
@@ -137,6 +173,21 @@ class Interpolator:
         assert self.valid_interval is not None
         return self.valid_interval.intersect(times)
 
+    def _select_valid(self, times: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Return the indices of the valid time points and the points themselves.
+
+        For sorted queries (the common case) the valid points form a contiguous
+        range. It is found by binary search and returned as a view of ``times``
+        instead of building a mask and gathering a copy.
+        """
+        assert self.valid_interval is not None
+        if times.ndim == 1 and _is_increasing(times, False):
+            lo = np.searchsorted(times, self.valid_interval.start, side="left")
+            hi = np.searchsorted(times, self.valid_interval.end, side="right")
+            return np.arange(lo, hi), times[lo:hi]
+        valid = self.valid_times(times)
+        return valid, times[valid]
+
     def close(self):
         ...
         # generally, nothing to do
@@ -154,7 +205,8 @@ class SequenceInterpolator(Interpolator):
     root_folder : str
         Path to the modality directory containing ``data.mem`` or ``data.npy``.
     cache_data : bool, default=False
-        If True, loads memory-mapped data into RAM for faster access.
+        If True, loads the data into RAM for faster access. Otherwise both
+        ``data.mem`` and ``data.npy`` are memory-mapped.
     keep_nans : bool, default=False
         If False and ``interpolation_mode='linear'``, replaces NaN values with
         column means during interpolation. For ``'nearest_neighbor'``, NaNs are
@@ -188,12 +240,17 @@ class SequenceInterpolator(Interpolator):
         y(t) = y_0 \\cdot \\frac{t_1 - t}{t_1 - t_0} + y_1 \\cdot \\frac{t - t_0}{t_1 - t_0},
 
     where :math:`t_0` and :math:`t_1` are the surrounding sample times.
+
+    The data may be stored quantized to a narrow integer dtype (e.g.
+    ``uint8``). If ``meta.yml`` provides ``scale`` (and optionally
+    ``zero_point``), looked-up samples are returned as float32
+    ``stored * scale + zero_point``.
     """
 
     def __init__(
         self,
         root_folder: str,
-        cache_data: bool = False,  # already cached, put it here for consistency
+        cache_data: bool = False,
         keep_nans: bool = False,
         interpolation_mode: str = "nearest_neighbor",
         normalize: bool = False,
@@ -217,6 +274,9 @@ class SequenceInterpolator(Interpolator):
         self.valid_interval = TimeInterval(self.start_time, self.end_time)
 
         self.n_signals = meta["n_signals"]
+        # optional affine quantization: value = stored * scale + zero_point
+        self._scale = meta.get("scale")
+        self._zero_point = meta.get("zero_point", 0.0)
         # read .mem (memmap) or .npy file
         if self.is_mem_mapped:
             self._data = np.memmap(
@@ -226,12 +286,19 @@ class SequenceInterpolator(Interpolator):
                 shape=(meta["n_timestamps"], meta["n_signals"]),
             )
 
-            if cache_data:
+            if cache_data and self._scale is None:
                 self._data = np.array(self._data).astype(
                     np.float32
                 )  # Convert memmap to ndarray
+            elif cache_data:
+                # keep quantized data narrow in RAM, it is dequantized on lookup
+                self._data = np.array(self._data)
         else:
-            self._data = np.load(self.root_folder / "data.npy")
+            # memory-map the .npy as well, so only the rows touched by interpolate
+            # are paged in, unless the caller asked for the data to be in RAM
+            self._data = np.load(
+                self.root_folder / "data.npy", mmap_mode=None if cache_data else "r"
+            )
 
         if self.normalize:
             self.normalize_init()
@@ -261,11 +328,16 @@ class SequenceInterpolator(Interpolator):
         data = data * self._precision
         return data
 
+    def _dequantize(self, data: np.ndarray) -> np.ndarray:
+        # applied after the gather, so only the queried rows are widened
+        if self._scale is None:
+            return data
+        return data.astype(np.float32) * self._scale + self._zero_point
+
     def interpolate(
         self, times: np.ndarray, return_valid: bool = False
     ) -> Union[tuple[np.ndarray, np.ndarray], np.ndarray]:
-        valid = self.valid_times(times)
-        valid_times = times[valid]
+        valid, valid_times = self._select_valid(times)
 
         if len(valid_times) == 0:
             warnings.warn(
@@ -277,12 +349,12 @@ class SequenceInterpolator(Interpolator):
                 else np.empty((0, self._data.shape[1]))
             )
 
-        idx_lower = np.floor((valid_times - self.start_time) / self.time_delta).astype(
-            int
-        )
+        # position of each query time on the sample grid, in units of samples
+        positions = (valid_times - self.start_time) / self.time_delta
+        idx_lower = np.floor(positions).astype(int)
 
         if self.interpolation_mode == "nearest_neighbor":
-            data = self._data[idx_lower]
+            data = self._dequantize(self._data[idx_lower])
 
             return (data, valid) if return_valid else data
 
@@ -294,26 +366,23 @@ class SequenceInterpolator(Interpolator):
                 warnings.warn(
                     f"Interpolation index {idx_lower} is negative. This should not happen."
                 )
-                overflow_mask = overflow_mask | idx_lower < 0
+                overflow_mask = overflow_mask | (idx_lower < 0)
 
             valid = valid[~overflow_mask]
 
             idx_upper = idx_upper[~overflow_mask]
             idx_lower = idx_lower[~overflow_mask]
 
-            times_lower = idx_lower * self.time_delta
-            times_upper = idx_upper * self.time_delta
-            denom = times_upper - times_lower
-
-            times_valid = valid_times[~overflow_mask]
-
-            lower_signal_ratio = ((times_upper - times_valid) / denom)[:, None]
-            upper_signal_ratio = ((times_valid - times_lower) / denom)[:, None]
+            # samples are uniformly spaced, so the linear weights are just the
+            # fractional part of the grid position (as in np.interp)
+            upper_signal_ratio = (positions[~overflow_mask] - idx_lower)[:, None]
+            lower_signal_ratio = 1.0 - upper_signal_ratio
 
             data_lower = self._data[idx_lower]
             data_upper = self._data[idx_upper]
 
-            interpolated = (
+            # the weights sum to one, so dequantizing after blending is exact
+            interpolated = self._dequantize(
                 lower_signal_ratio * data_lower + upper_signal_ratio * data_upper
             )
 
@@ -334,6 +403,34 @@ class SequenceInterpolator(Interpolator):
         del self._data
 
 
+# Fuses the subtract/divide/floor/gather of the phase-shifted nearest neighbor
+# lookup into one pass, so no (n_times, n_signals) temporaries are materialized.
+# cache=True stores the compiled code on disk, so new processes (e.g. dataloader
+# workers) skip the JIT compilation.
+# fastmath is left off on purpose: it allows rewriting the division as a
+# multiplication by the reciprocal, which can move samples across a floor boundary.
+@njit(parallel=True, cache=True)
+def _fast_phase_shifted_gather(data, times, offsets, time_delta, out):
+    """
+    data: 2D array (n_samples, n_signals)
+    times: 1D array - query times
+    offsets: 1D array - per-signal phase shift plus start time
+    time_delta: float - time between samples
+    out: 2D array (n_times, n_signals)
+    """
+    n_samples = data.shape[0]
+    n_signals = offsets.shape[0]
+
+    for i in prange(times.shape[0]):
+        t = times[i]
+        for s in range(n_signals):
+            idx = int(np.floor((t - offsets[s]) / time_delta))
+            # Clamp for safety: numba does not bounds-check the read below.
+            # min/max instead of branches keeps the loop body vectorizable.
+            idx = min(max(idx, 0), n_samples - 1)
+            out[i, s] = data[idx, s]
+
+
 class PhaseShiftedSequenceInterpolator(SequenceInterpolator):
     """Sequence interpolator with per-signal phase shifts.
 
@@ -357,7 +454,7 @@ class PhaseShiftedSequenceInterpolator(SequenceInterpolator):
     def __init__(
         self,
         root_folder: str,
-        cache_data: bool = False,  # already cached, put it here for consistency
+        cache_data: bool = False,
         keep_nans: bool = False,
         interpolation_mode: str = "nearest_neighbor",
         normalize: bool = False,
@@ -383,12 +480,19 @@ class PhaseShiftedSequenceInterpolator(SequenceInterpolator):
             self.end_time
             + (np.min(self._phase_shifts) if len(self._phase_shifts) > 0 else 0),
         )
+        # fold start_time into the shifts once and precompute the column index,
+        # so interpolate only builds a single (n_times, n_signals) index array
+        self._shift_offsets = self._phase_shifts + self.start_time
+        self._col_idx = np.arange(self._data.shape[1])
+        # numba cannot compile the gather kernel for every dtype (e.g. float16)
+        self._use_gather_kernel = self._data.dtype.kind in "biuc" or (
+            self._data.dtype in (np.float32, np.float64)
+        )
 
     def interpolate(
         self, times: np.ndarray, return_valid: bool = False
     ) -> Union[tuple[np.ndarray, np.ndarray], np.ndarray]:
-        valid = self.valid_times(times)
-        valid_times = times[valid]
+        valid, valid_times = self._select_valid(times)
 
         if len(valid_times) == 0:
             warnings.warn(
@@ -400,20 +504,31 @@ class PhaseShiftedSequenceInterpolator(SequenceInterpolator):
                 else np.empty((0, self._data.shape[1]))
             )
 
-        idx_lower = np.floor(
-            (
-                valid_times[:, np.newaxis]
-                - self._phase_shifts[np.newaxis, :]
-                - self.start_time
+        if self.interpolation_mode == "nearest_neighbor" and self._use_gather_kernel:
+            data = np.empty(
+                (len(valid_times), self._data.shape[1]), dtype=self._data.dtype
+            )
+            _fast_phase_shifted_gather(
+                self._data,
+                np.ascontiguousarray(valid_times, dtype=np.float64),
+                self._shift_offsets,
+                self.time_delta,
+                data,
             )
-            / self.time_delta
-        ).astype(int)
+            data = self._dequantize(data)
+            return (data, valid) if return_valid else data
+
+        # per-signal position of each query time on the sample grid
+        positions = (
+            valid_times[:, np.newaxis] - self._shift_offsets[np.newaxis, :]
+        ) / self.time_delta
+        idx_lower = np.floor(positions).astype(int)
 
         if self.interpolation_mode == "nearest_neighbor":
-            data = np.take_along_axis(self._data, idx_lower, axis=0)
+            data = self._dequantize(self._data[idx_lower, self._col_idx])
             return (data, valid) if return_valid else data
 
-        elif self.interpolation_mode == "linear":
+        if self.interpolation_mode == "linear":
             idx_upper = idx_lower + 1
             overflow_mask = idx_upper >= self._data.shape[0]
 
@@ -421,27 +536,31 @@ class PhaseShiftedSequenceInterpolator(SequenceInterpolator):
                 warnings.warn(
                     f"Interpolation index {idx_lower} is negative. This should not happen."
                 )
-                overflow_mask = overflow_mask | idx_lower < 0
+                overflow_mask = overflow_mask | (idx_lower < 0)
 
-            valid = valid[~overflow_mask.any(axis=1)]
+            in_range = ~overflow_mask.any(axis=1)
+            valid = valid[in_range]
 
-            times_lower = idx_lower * self.time_delta
-            times_upper = idx_upper * self.time_delta
-            denom = times_upper - times_lower
+            idx_lower = idx_lower[in_range]
 
-            time_dim = valid_times[:, np.newaxis] - self._phase_shifts[np.newaxis, :]
+            upper_signal_ratio = positions[in_range] - idx_lower
+            lower_signal_ratio = 1.0 - upper_signal_ratio
 
-            lower_numerator = times_upper - time_dim
-            upper_numerator = time_dim - times_lower
-
-            lower_signal_ratio = lower_numerator / denom
-            upper_signal_ratio = upper_numerator / denom
-
-            _, cols = np.indices(idx_lower.shape)
-            data_lower = self._data[idx_lower, cols]
-            data_upper = self._data[idx_upper, cols]
+            if self._data.flags.c_contiguous:
+                # gather from a flat view of the data with one linear index; the
+                # upper neighbour of each sample is exactly one row further on
+                n_signals = self._data.shape[1]
+                data_flat = self._data.reshape(-1)
+                lin_lower = idx_lower * n_signals + self._col_idx
+                data_lower = data_flat[lin_lower]
+                data_upper = data_flat[lin_lower + n_signals]
+            else:
+                # e.g. a Fortran-order data.npy: reshape(-1) would copy all of it
+                data_lower = self._data[idx_lower, self._col_idx]
+                data_upper = self._data[idx_lower + 1, self._col_idx]
 
-            interpolated = (
+            # the weights sum to one, so dequantizing after blending is exact
+            interpolated = self._dequantize(
                 lower_signal_ratio * data_lower + upper_signal_ratio * data_upper
             )
 
@@ -479,6 +598,11 @@ class ScreenInterpolator(Interpolator):
         native image size from metadata.
     normalize : bool, default=False
         If True, normalizes frames using stored mean/std statistics.
+    io_workers : int, default=1
+        Number of threads used to read and copy trial files concurrently when
+        a query spans several trials that are not cached in RAM. The default
+        of 1 processes them sequentially; larger values only pay off when
+        trial files are read from slow storage.
     **kwargs
         Additional keyword arguments (ignored).
 
@@ -503,6 +627,7 @@ class ScreenInterpolator(Interpolator):
         rescale: bool = False,
         rescale_size: typing.Optional[tuple[int, int]] = None,
         normalize: bool = False,
+        io_workers: int = 1,
         **kwargs,
     ) -> None:
         super().__init__(root_folder)
@@ -512,13 +637,27 @@ class ScreenInterpolator(Interpolator):
         self.valid_interval = TimeInterval(self.start_time, self.end_time)
         self.rescale = rescale
         self.cache_trials = cache_data  # Store the cache preference
+        self.io_workers = io_workers
+        self._executor = None
+        self._executor_pid = None
+        # Fixed-rate displays give (nearly) uniform timestamps, then frame indices
+        # can be computed arithmetically instead of by binary search. Within a
+        # quarter frame of the ideal grid the guess is off by at most one.
+        self._frame_dt = None
+        if len(self.timestamps) > 1:
+            frame_dt = (self.end_time - self.start_time) / (len(self.timestamps) - 1)
+            grid = self.start_time + np.arange(len(self.timestamps)) * frame_dt
+            if frame_dt > 0 and np.max(np.abs(self.timestamps - grid)) < frame_dt / 4:
+                self._frame_dt = frame_dt
         self._parse_trials()
 
         # create mapping from image index to file index
-        self._num_frames = [t.num_frames for t in self.trials]
-        self._first_frame_idx = [t.first_frame_idx for t in self.trials]
-        self._data_file_idx = np.concatenate(
-            [np.full(t.num_frames, i) for i, t in enumerate(self.trials)]
+        self._num_frames = np.array([t.num_frames for t in self.trials], dtype=np.int64)
+        self._first_frame_idx = np.array(
+            [t.first_frame_idx for t in self.trials], dtype=np.int64
+        )
+        self._data_file_idx = np.repeat(
+            np.arange(len(self.trials), dtype=np.int64), self._num_frames
         )
         # infer image size
         if not rescale_size:
@@ -557,18 +696,20 @@ class ScreenInterpolator(Interpolator):
         all_data = {}
 
         # Get meta files and sort by number
-        meta_files = [
-            f
-            for f in (self.root_folder / "meta").iterdir()
-            if f.is_file() and is_numbered_yml(f.name)
-        ]
+        # (scandir reports the file type without an extra stat call per file)
+        with os.scandir(self.root_folder / "meta") as entries:
+            meta_files = [
+                entry
+                for entry in entries
+                if entry.is_file() and is_numbered_yml(entry.name)
+            ]
         meta_files.sort(key=lambda f: int(os.path.splitext(f.name)[0]))
 
         # Read each YAML file and store under its filename
         for meta_file in meta_files:
-            with open(meta_file, "r") as file:
-                file_base_name = meta_file.stem
-                yaml_content = yaml.safe_load(file)
+            with open(meta_file.path, "r") as file:
+                file_base_name = os.path.splitext(meta_file.name)[0]
+                yaml_content = yaml.load(file, Loader=_YamlSafeLoader)
                 all_data[file_base_name] = yaml_content
 
         output_path = self.root_folder / "combined_meta.json"
@@ -605,47 +746,141 @@ class ScreenInterpolator(Interpolator):
             )
 
     def interpolate(
-        self, times: np.ndarray, return_valid: bool = False
+        self,
+        times: np.ndarray,
+        return_valid: bool = False,
+        out: typing.Optional[np.ndarray] = None,
     ) -> Union[tuple[np.ndarray, np.ndarray], np.ndarray]:
-        valid = self.valid_times(times)
-        valid_times = times[valid]
-        valid_times += 1e-4  # add small offset to avoid numerical issues
-
-        assert np.all(np.diff(valid_times) > 0), "Times must be sorted"
-        idx = cast(
-            np.ndarray, np.searchsorted(self.timestamps, valid_times) - 1
-        )  # convert times to frame indices
-        assert np.all(
-            (idx >= 0) & (idx < len(self.timestamps))
+        """Look up the frame shown at each of the given times.
+
+        Parameters
+        ----------
+        times : np.ndarray
+            Sorted 1D array of time points.
+        return_valid : bool, default=False
+            If True, also return the indices of the valid time points.
+        out : np.ndarray, optional
+            Preallocated float32 array of shape ``(n_valid, *image_size)`` to
+            write the frames into, e.g. to reuse a buffer across calls.
+
+        Returns
+        -------
+        np.ndarray or tuple of np.ndarray
+            Frames for the valid time points, and their indices if
+            ``return_valid`` is True.
+        """
+        valid, valid_times = self._select_valid(times)
+        # add small offset to avoid numerical issues (not in place, this may be a view)
+        valid_times = valid_times + 1e-4
+
+        assert _is_increasing(valid_times, True), "Times must be sorted"
+        idx = self._frame_index(valid_times)  # convert times to frame indices
+        # idx is sorted as well, so checking the end points covers all of them
+        assert len(idx) == 0 or (
+            idx[0] >= 0 and idx[-1] < len(self.timestamps)
         ), "All times must be within the valid range"
         data_file_idx = self._data_file_idx[idx]
+        # frame index within each trial file, for all queried frames at once
+        local_idx = idx - self._first_frame_idx[data_file_idx]
 
-        # Go through files, load them and extract all frames
-        unique_file_idx = np.unique(data_file_idx)
-        out = np.zeros([len(valid_times)] + list(self._image_size), dtype=np.float32)
-        for u_idx in unique_file_idx:
-            data = self.trials[u_idx].get_data()
-            # TODO: establish convention of dimensons for time/channels. Then we can remove this
-            # TODO: revisit this for on the fly decoding
-            if ((len(data.shape) == 2) or (data.shape[-1] == 3)) and (
-                len(data.shape) < 4
-            ):
-                data = np.expand_dims(data, axis=0)
-            idx_for_this_file = np.where(self._data_file_idx[idx] == u_idx)
-            if self.rescale:
-                orig_size = data[idx[idx_for_this_file] - self._first_frame_idx[u_idx]]
-                out[idx_for_this_file] = np.stack(
-                    [
-                        self.rescale_frame(np.asarray(frame, dtype=np.float32).T).T
-                        for frame in orig_size
-                    ]
-                )
-            else:
-                out[idx_for_this_file] = data[
-                    idx[idx_for_this_file] - self._first_frame_idx[u_idx]
-                ]
+        # times are sorted, so frames of the same file form contiguous runs
+        run_change = np.flatnonzero(np.diff(data_file_idx)) + 1
+        run_starts = np.concatenate(([0], run_change))
+        run_stops = np.concatenate((run_change, [len(idx)]))
+
+        runs = [
+            (start, stop) for start, stop in zip(run_starts, run_stops) if start < stop
+        ]
+
+        # every row is written by exactly one run below, so no need to zero it
+        out_shape = (len(valid_times),) + tuple(self._image_size)
+        if out is None:
+            out = np.empty(out_shape, dtype=np.float32)
+        elif out.shape != out_shape or out.dtype != np.float32:
+            raise ValueError(
+                f"out must be a float32 array of shape {out_shape}, "
+                f"got {out.dtype} array of shape {out.shape}"
+            )
+
+        # Go through files, load them and extract all frames. Runs write to
+        # disjoint slices of out, so they can be filled independently.
+        jobs = [
+            (self.trials[data_file_idx[start]], local_idx[start:stop], out[start:stop])
+            for start, stop in runs
+        ]
+        if self.io_workers > 1 and len(jobs) > 1 and not self.cache_trials:
+            # list() to wait for all runs and re-raise errors from workers
+            list(self._get_executor().map(lambda job: self._fill_run(*job), jobs))
+        else:
+            for job in jobs:
+                self._fill_run(*job)
         return (out, valid) if return_valid else out
 
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return the thread pool for reading trial files, creating it lazily.
+
+        Threads do not survive a fork, so the pool is rebuilt when used from a
+        different process (e.g. a dataloader worker) than the one that made it.
+        """
+        if self._executor is None or self._executor_pid != os.getpid():
+            self._executor = ThreadPoolExecutor(max_workers=self.io_workers)
+            self._executor_pid = os.getpid()
+        return self._executor
+
+    def __getstate__(self) -> dict:
+        # The pool holds threads and locks that cannot be pickled; it is
+        # rebuilt lazily by _get_executor after unpickling.
+        state = self.__dict__.copy()
+        state["_executor"] = None
+        state["_executor_pid"] = None
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+
+    def close(self) -> None:
+        super().close()
+        if self._executor is not None and self._executor_pid == os.getpid():
+            self._executor.shutdown()
+        self._executor = None
+
+    def _fill_run(
+        self, trial: ScreenTrial, frame_idx: np.ndarray, out: np.ndarray
+    ) -> None:
+        """Copy the given frames of one trial into ``out``."""
+        data = trial.get_data()
+        # TODO: establish convention of dimensons for time/channels. Then we can remove this
+        # TODO: revisit this for on the fly decoding
+        if ((len(data.shape) == 2) or (data.shape[-1] == 3)) and (len(data.shape) < 4):
+            data = np.expand_dims(data, axis=0)
+        if self.rescale:
+            out[:] = np.stack(
+                [
+                    self.rescale_frame(np.asarray(frame, dtype=np.float32).T).T
+                    for frame in data[frame_idx]
+                ]
+            )
+        else:
+            out[:] = data[frame_idx]
+
+    def _frame_index(self, times: np.ndarray) -> np.ndarray:
+        """Index of the last frame shown strictly before each time point.
+
+        Equivalent to ``np.searchsorted(self.timestamps, times) - 1``.
+        """
+        if self._frame_dt is None:
+            return cast(np.ndarray, np.searchsorted(self.timestamps, times) - 1)
+
+        n_frames = len(self.timestamps)
+        idx = np.floor((times - self.start_time) / self._frame_dt).astype(np.int64)
+        np.clip(idx, 0, n_frames - 1, out=idx)
+        # correct the guess by one frame in either direction
+        idx -= self.timestamps[idx] >= times
+        idx += (idx + 1 < n_frames) & (
+            self.timestamps[np.minimum(idx + 1, n_frames - 1)] < times
+        )
+        return idx
+
     def rescale_frame(self, frame: np.ndarray) -> np.ndarray:
         """Rescale frame to the configured image size.
 
@@ -726,8 +961,7 @@ class TimeIntervalInterpolator(Interpolator):
     def interpolate(
         self, times: np.ndarray, return_valid: bool = False
     ) -> Union[tuple[np.ndarray, np.ndarray], np.ndarray]:
-        valid = self.valid_times(times)
-        valid_times = times[valid]
+        valid, valid_times = self._select_valid(times)
 
         n_labels = len(self.meta_labels)
         n_times = len(valid_times)
@@ -768,6 +1002,23 @@ class TimeIntervalInterpolator(Interpolator):
         return (out, valid) if return_valid else out
 
 
+def _read_npy_header(file_name: Union[str, Path]) -> typing.Optional[tuple]:
+    """Read shape, memory order, dtype and data offset of a ``.npy`` file.
+
+    Returns None for format versions without a public header reader (e.g. 3.0,
+    which stores a UTF-8 header), so the caller can fall back to ``np.load``.
+    """
+    with open(file_name, "rb") as f:
+        version = fmt.read_magic(f)
+        if version == (1, 0):
+            shape, fortran_order, dtype = fmt.read_array_header_1_0(f)
+        elif version == (2, 0):
+            shape, fortran_order, dtype = fmt.read_array_header_2_0(f)
+        else:
+            return None
+        return shape, fortran_order, dtype, f.tell()
+
+
 class ScreenTrial:
     """Base class for visual stimulus trials.
 
@@ -807,8 +1058,10 @@ class ScreenTrial:
         self.num_frames = num_frames
         self._cached_data = None
         self._cache_data = cache_data
+        self._npy_header = None
         if self._cache_data:
-            self._cached_data = self.get_data_()
+            # copy, so a memory-mapped file ends up fully in RAM
+            self._cached_data = np.array(self.get_data_())
 
     @staticmethod
     def create(
@@ -818,13 +1071,29 @@ class ScreenTrial:
     ) -> "ScreenTrial":
         modality = meta_data.get("modality")
         assert modality is not None
-        class_name = modality.lower().capitalize() + "Trial"
-        assert class_name in globals(), f"Unknown modality: {modality}"
-        return globals()[class_name](data_file_name, meta_data, cache_data=cache_data)
+        trial_class = _SCREEN_TRIAL_CLASSES.get(modality.lower())
+        assert trial_class is not None, f"Unknown modality: {modality}"
+        return trial_class(data_file_name, meta_data, cache_data=cache_data)
 
     def get_data_(self) -> np.ndarray:
         """Base implementation for loading/generating data"""
-        return np.load(self.data_file_name)
+        # Parse the .npy header once and memory-map the raw buffer afterwards,
+        # so only the frames that are indexed get read from disk.
+        if self._npy_header is None:
+            self._npy_header = _read_npy_header(self.data_file_name)
+        if self._npy_header is None:
+            return np.load(self.data_file_name)
+        shape, fortran_order, dtype, offset = self._npy_header
+        if dtype.hasobject or np.prod(shape) == 0:
+            return np.load(self.data_file_name)
+        return np.memmap(
+            self.data_file_name,
+            dtype=dtype,
+            mode="r",
+            offset=offset,
+            shape=shape,
+            order="F" if fortran_order else "C",
+        )
 
     def get_data(self) -> np.ndarray:
         """Wrapper that handles caching"""
@@ -904,10 +1173,18 @@ class InvalidTrial(ScreenTrial):
         return np.full((1,) + self.image_size, self.interleave_value, dtype=np.float32)
 
 
+_SCREEN_TRIAL_CLASSES: dict[str, typing.Callable[..., ScreenTrial]] = {
+    "image": ImageTrial,
+    "video": VideoTrial,
+    "blank": BlankTrial,
+    "invalid": InvalidTrial,
+}
+
+
 #  Numba JIT decorator: compiles Python function to fast machine code at runtime (mainly for numerical loops).
 #  This decorator does not know how to handle self, so it cannot be a member of a class, here SpikeInterpolator.
 # 'parallel=True' allows it to use all CPU cores.
-@njit(parallel=True, fastmath=True)
+@njit(parallel=True, fastmath=True, cache=True)
 def _fast_count_spikes(all_spikes, indices, window_starts, window_ends, out_counts):
     """
     all_spikes: 1D array
@@ -1053,8 +1330,7 @@ class SpikeInterpolator(Interpolator):
         self, times: np.ndarray, return_valid: bool = False
     ) -> Union[tuple[np.ndarray, np.ndarray], np.ndarray]:
         # 1. Filter for valid times
-        valid = self.valid_times(times)
-        valid_times = times[valid]
+        valid, valid_times = self._select_valid(times)
 
         # Handle edge case where no times are valid
         if len(valid_times) == 0:
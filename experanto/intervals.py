@@ -43,7 +43,10 @@ class TimeInterval(typing.NamedTuple):
         return f"TimeInterval(start={self.start}, end={self.end})"
 
     def intersect(self, times: np.ndarray) -> np.ndarray:
-        return np.where((times >= self.start) & (times <= self.end))[0]
+        # combine the bounds in place instead of allocating a third mask
+        mask = np.greater_equal(times, self.start)
+        mask &= np.less_equal(times, self.end)
+        return np.flatnonzero(mask)
 
 
 def uniquefy_interval_array(interval_array: List[TimeInterval]) -> List[TimeInterval]:
@@ -15,16 +15,19 @@ def create_sequence_data(
     n_signals=10,
     shifts_per_signal=False,
     use_mem_mapped=False,
+    t_start=0.0,
     t_end=10.0,
     sampling_rate=10.0,
     contain_nans=False,
+    quantize=False,
+    dtype=np.float64,
 ):
     try:
         SEQUENCE_ROOT.mkdir(parents=True, exist_ok=True)
         (SEQUENCE_ROOT / "meta").mkdir(parents=True, exist_ok=True)
 
         meta = {
-            "start_time": 0,
+            "start_time": t_start,
             "end_time": t_end,
             "modality": "sequence",
             "sampling_rate": sampling_rate,
@@ -41,7 +44,7 @@ def create_sequence_data(
         np.save(SEQUENCE_ROOT / "timestamps.npy", timestamps)
         meta["n_timestamps"] = len(timestamps)
 
-        data = np.random.rand(len(timestamps), n_signals)
+        data = np.random.rand(len(timestamps), n_signals).astype(dtype)
 
         if contain_nans:
             nan_indices = np.random.choice(
@@ -49,6 +52,13 @@ def create_sequence_data(
             )
             data.flat[nan_indices] = np.nan
 
+        if quantize:
+            meta["zero_point"] = float(data.min())
+            meta["scale"] = float((data.max() - data.min()) / 255)
+            data = np.round((data - meta["zero_point"]) / meta["scale"]).astype(
+                np.uint8
+            )
+
         if not use_mem_mapped:
             np.save(SEQUENCE_ROOT / "data.npy", data)
         else:
@@ -67,6 +77,9 @@ def create_sequence_data(
         with open(SEQUENCE_ROOT / "meta.yml", "w") as f:
             yaml.safe_dump(meta, f)
 
+        if quantize:
+            data = data * meta["scale"] + meta["zero_point"]
+
         yield timestamps, data, shifts if shifts_per_signal else None
     finally:
         shutil.rmtree(SEQUENCE_ROOT)
@@ -1,3 +1,4 @@
+import pickle
 from pathlib import Path
 
 import numpy as np
@@ -107,3 +108,192 @@ def test_nearest_neighbor_interpolation_default_return_valid():
         assert np.array_equal(
             result, interp
         ), "Data from default (no return_valid) should match data from return_valid=True"
+
+
+def test_unsorted_times_raise():
+    with create_screen_data(
+        duration=10,
+        frame_shape=(32, 32),
+        fps=10.0,
+        image_frame_count=10,
+        num_videos=1,
+    ) as timestamps:
+        interp_obj = Interpolator.create("tests/screen_data")
+
+        times = timestamps[:-1].copy()
+        times[[3, 4]] = times[[4, 3]]
+
+        with pytest.raises(AssertionError, match="Times must be sorted"):
+            interp_obj.interpolate(times=times)
+
+
+def test_threaded_trial_loading_matches_sequential():
+    with create_screen_data(
+        duration=10,
+        frame_shape=(32, 32),
+        fps=10.0,
+        image_frame_count=50,
+        num_videos=5,
+    ) as timestamps:
+        sequential = Interpolator.create("tests/screen_data", io_workers=1)
+        threaded = Interpolator.create("tests/screen_data", io_workers=4)
+
+        times = timestamps[:-1] + 0.4 * (1.0 / 10.0)
+        assert np.array_equal(
+            sequential.interpolate(times=times), threaded.interpolate(times=times)
+        ), "Threaded trial loading should match sequential loading"
+
+
+def test_interpolation_into_preallocated_out():
+    with create_screen_data(
+        duration=10,
+        frame_shape=(32, 32),
+        fps=10.0,
+        image_frame_count=10,
+        num_videos=1,
+    ) as timestamps:
+        interp_obj = Interpolator.create("tests/screen_data")
+
+        times = timestamps[:-1] + 0.4 * (1.0 / 10.0)
+        expected = interp_obj.interpolate(times=times)
+
+        out = np.full((len(times), 32, 32), np.nan, dtype=np.float32)
+        result = interp_obj.interpolate(times=times, out=out)
+        assert result is out, "Expected the frames to be written into out"
+        assert np.array_equal(out, expected), "Frames written into out mismatch"
+
+        with pytest.raises(ValueError, match="out must be a float32 array"):
+            interp_obj.interpolate(times=times, out=np.empty((1, 32, 32)))
+
+
+@pytest.mark.parametrize("jitter, uniform", [(0.0, True), (0.1, True), (0.5, False)])
+def test_frame_index_matches_searchsorted(jitter, uniform):
+    fps = 10.0
+    with create_screen_data(
+        duration=10,
+        frame_shape=(32, 32),
+        fps=fps,
+        image_frame_count=10,
+        num_videos=1,
+    ) as timestamps:
+        rng = np.random.default_rng(0)
+        timestamps = timestamps + rng.uniform(-jitter, jitter, len(timestamps)) / fps
+        np.save(Path("tests/screen_data") / "timestamps.npy", timestamps)
+
+        interp_obj = Interpolator.create("tests/screen_data")
+        assert isinstance(interp_obj, ScreenInterpolator), "Expected ScreenInterpolator"
+        assert (
+            interp_obj._frame_dt is not None
+        ) == uniform, "Uniform timestamp detection mismatch"
+
+        times = np.sort(
+            np.concatenate(
+                [
+                    timestamps,
+                    timestamps + 1e-9,
+                    rng.uniform(timestamps[0] - 1.0, timestamps[-1] + 1.0, 1000),
+                ]
+            )
+        )
+        assert np.array_equal(
+            interp_obj._frame_index(times), np.searchsorted(timestamps, times) - 1
+        ), "Frame index does not match np.searchsorted"
+
+
+def test_contains():
+    with create_screen_data(
+        duration=10,
+        frame_shape=(32, 32),
+        fps=10.0,
+        image_frame_count=10,
+        num_videos=1,
+    ) as timestamps:
+        interp_obj = Interpolator.create("tests/screen_data")
+
+        assert np.array([timestamps[0], 20.0]) in interp_obj
+        assert np.array([-5.0, 20.0]) not in interp_obj
+
+
+@pytest.mark.parametrize("cache_data", [False, True])
+def test_trial_data_is_memory_mapped_unless_cached(cache_data):
+    with create_screen_data(
+        duration=10,
+        frame_shape=(32, 32),
+        fps=10.0,
+        image_frame_count=10,
+        num_videos=3,
+    ) as timestamps:
+        interp_obj = Interpolator.create("tests/screen_data", cache_data=cache_data)
+        assert isinstance(interp_obj, ScreenInterpolator), "Expected ScreenInterpolator"
+
+        for trial in interp_obj.trials:
+            data = trial.get_data()
+            assert isinstance(data, np.memmap) != cache_data
+            assert np.array_equal(data, np.load(trial.data_file_name))
+
+
+@pytest.mark.parametrize("cache_data", [False, True])
+def test_thread_pool_is_reused_and_skipped_for_cached_trials(cache_data):
+    with create_screen_data(
+        duration=10,
+        frame_shape=(32, 32),
+        fps=10.0,
+        image_frame_count=50,
+        num_videos=5,
+    ) as timestamps:
+        interp_obj = Interpolator.create(
+            "tests/screen_data", cache_data=cache_data, io_workers=4
+        )
+        times = timestamps[:-1] + 0.4 * (1.0 / 10.0)
+
+        interp_obj.interpolate(times=times)
+        executor = interp_obj._executor
+        assert (executor is None) == cache_data, "Pool only needed for uncached trials"
+
+        interp_obj.interpolate(times=times)
+        assert interp_obj._executor is executor, "Expected the pool to be reused"
+
+        interp_obj.close()
+        assert interp_obj._executor is None, "Expected close to release the pool"
+
+
+def test_pickle_after_threaded_interpolation():
+    with create_screen_data(
+        duration=10,
+        frame_shape=(32, 32),
+        fps=10.0,
+        image_frame_count=50,
+        num_videos=5,
+    ) as timestamps:
+        interp_obj = Interpolator.create("tests/screen_data", io_workers=4)
+        times = timestamps[:-1] + 0.4 * (1.0 / 10.0)
+        expected = interp_obj.interpolate(times=times)
+        assert interp_obj._executor is not None, "Expected a threaded read"
+
+        restored = pickle.loads(pickle.dumps(interp_obj))
+        assert restored._executor is None, "Pool should not be carried over"
+        assert interp_obj._executor is not None, "Pickling must not drop the pool"
+        assert np.array_equal(restored.interpolate(times=times), expected)
+        assert restored._executor is not None, "Expected the pool to be rebuilt"
+
+        restored.close()
+        interp_obj.close()
+
+
+@pytest.mark.parametrize("version", [(1, 0), (2, 0), (3, 0)])
+def test_trial_data_for_npy_format_versions(version):
+    with create_screen_data(
+        duration=10,
+        frame_shape=(32, 32),
+        fps=10.0,
+        image_frame_count=10,
+        num_videos=1,
+    ) as timestamps:
+        file_name = Path("tests/screen_data") / "data" / "00000.npy"
+        frame = np.load(file_name)
+        with open(file_name, "wb") as f:
+            np.lib.format.write_array(f, frame, version=version)
+
+        interp_obj = Interpolator.create("tests/screen_data")
+        assert isinstance(interp_obj, ScreenInterpolator), "Expected ScreenInterpolator"
+        assert np.array_equal(interp_obj.trials[0].get_data(), frame)
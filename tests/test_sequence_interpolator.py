@@ -1,12 +1,15 @@
+from contextlib import closing
+
 import numpy as np
 import pytest
 
 from experanto.interpolators import (
+    Interpolator,
     PhaseShiftedSequenceInterpolator,
     SequenceInterpolator,
 )
 
-from .create_sequence_data import sequence_data_and_interpolator
+from .create_sequence_data import create_sequence_data, sequence_data_and_interpolator
 
 DEFAULT_SEQUENCE_LENGTH = 10
 
@@ -330,6 +333,37 @@ def test_linear_interpolation_with_phase_shifts(
                 ), "Interpolated data should not contain NaNs"
 
 
+@pytest.mark.parametrize("shifts_per_signal", [False, True])
+def test_linear_interpolation_with_nonzero_start_time(shifts_per_signal):
+    sampling_rate = 10.0
+    with sequence_data_and_interpolator(
+        data_kwargs=dict(
+            n_signals=10,
+            t_start=100.0,
+            t_end=105.0,
+            sampling_rate=sampling_rate,
+            shifts_per_signal=shifts_per_signal,
+        ),
+        interp_kwargs=dict(interpolation_mode="linear"),
+    ) as (timestamps, data, shift, seq_interp):
+        delta_t = 1.0 / sampling_rate
+        shift = shift if shifts_per_signal else np.zeros(data.shape[1])
+        times = timestamps[1 : DEFAULT_SEQUENCE_LENGTH + 1] + 0.25 * delta_t
+
+        interp, valid = seq_interp.interpolate(
+            times=times + shift.max(), return_valid=True
+        )
+        assert times.shape == valid.shape, "All samples should be valid"
+
+        for sig_idx in range(data.shape[1]):
+            expected = np.interp(
+                times + shift.max(), timestamps + shift[sig_idx], data[:, sig_idx]
+            )
+            assert np.allclose(
+                interp[:, sig_idx], expected, atol=1e-6
+            ), f"Linear interpolation mismatch for signal {sig_idx}"
+
+
 @pytest.mark.filterwarnings(
     "ignore:Sequence interpolation returns empty array, no valid times queried:UserWarning"
 )
@@ -540,6 +574,158 @@ def test_linear_interpolation_default_return_valid():
         ), "Data from default (no return_valid) should match data from return_valid=True"
 
 
+@pytest.mark.parametrize("use_mem_mapped", [False, True])
+@pytest.mark.parametrize("cache_data", [False, True])
+def test_data_is_memory_mapped_unless_cached(use_mem_mapped, cache_data):
+    with sequence_data_and_interpolator(
+        data_kwargs=dict(use_mem_mapped=use_mem_mapped),
+        interp_kwargs=dict(cache_data=cache_data),
+    ) as (timestamps, data, _, seq_interp):
+        assert isinstance(seq_interp._data, np.memmap) != cache_data, (
+            f"Expected memory-mapped data: {not cache_data}, "
+            f"got {type(seq_interp._data).__name__}"
+        )
+
+        times = timestamps[:DEFAULT_SEQUENCE_LENGTH] + 1e-9
+        interp = seq_interp.interpolate(times=times)
+        assert np.allclose(
+            interp, data[:DEFAULT_SEQUENCE_LENGTH]
+        ), "Nearest neighbor interpolation does not match expected data"
+
+
+@pytest.mark.parametrize("interpolation_mode", ["nearest_neighbor", "linear"])
+@pytest.mark.parametrize("use_mem_mapped", [False, True])
+@pytest.mark.parametrize("shifts_per_signal", [False, True])
+@pytest.mark.parametrize("cache_data", [False, True])
+def test_interpolation_of_quantized_data(
+    interpolation_mode, use_mem_mapped, shifts_per_signal, cache_data
+):
+    with sequence_data_and_interpolator(
+        data_kwargs=dict(
+            n_signals=10,
+            use_mem_mapped=use_mem_mapped,
+            t_end=5.0,
+            sampling_rate=10.0,
+            shifts_per_signal=shifts_per_signal,
+            quantize=True,
+        ),
+        interp_kwargs=dict(
+            interpolation_mode=interpolation_mode, cache_data=cache_data
+        ),
+    ) as (timestamps, data, shift, seq_interp):
+        assert seq_interp._data.dtype == np.uint8, "Expected data to stay quantized"
+
+        shift = shift if shifts_per_signal else np.zeros(data.shape[1])
+        times = timestamps[1 : DEFAULT_SEQUENCE_LENGTH + 1] + 0.5 / 10.0
+
+        interp = seq_interp.interpolate(times=times + shift.max())
+        assert interp.dtype == np.float32, "Expected dequantized float32 output"
+
+        for sig_idx in range(data.shape[1]):
+            expected = (
+                np.interp(
+                    times + shift.max(), timestamps + shift[sig_idx], data[:, sig_idx]
+                )
+                if interpolation_mode == "linear"
+                else data[
+                    np.floor((times + shift.max() - shift[sig_idx]) * 10.0).astype(int),
+                    sig_idx,
+                ]
+            )
+            assert np.allclose(
+                interp[:, sig_idx], expected, atol=1e-5
+            ), f"Dequantized interpolation mismatch for signal {sig_idx}"
+
+
+@pytest.mark.parametrize("shifts_per_signal", [False, True])
+def test_contains(shifts_per_signal):
+    with sequence_data_and_interpolator(
+        data_kwargs=dict(t_end=5.0, shifts_per_signal=shifts_per_signal)
+    ) as (_, _, _, seq_interp):
+        assert 2.5 in seq_interp, "Scalar inside the valid interval"
+        assert 10.0 not in seq_interp, "Scalar outside the valid interval"
+        assert np.array([2.5, 10.0]) in seq_interp, "Only first time point valid"
+        assert np.array([-1.0, 2.5]) in seq_interp, "Only last time point valid"
+        assert (
+            np.array([-1.0, 10.0]) not in seq_interp
+        ), "Times straddle the valid interval without any inside"
+        assert np.array([]) not in seq_interp, "Empty times"
+
+
+@pytest.mark.parametrize(
+    "times",
+    [
+        np.array([-1.0, 0.0, 2.5, 2.5, 5.0, 5.5]),
+        np.array([2.5, -1.0, 4.0, 0.5, 7.0]),
+        np.array([0.5, np.nan, 1.5, 6.0]),
+        np.array([]),
+    ],
+)
+def test_select_valid_matches_valid_times(times):
+    with sequence_data_and_interpolator(data_kwargs=dict(t_end=5.0)) as (
+        _,
+        _,
+        _,
+        seq_interp,
+    ):
+        valid, valid_times = seq_interp._select_valid(times)
+        expected_valid = seq_interp.valid_times(times)
+        assert np.array_equal(valid, expected_valid), "Valid indices mismatch"
+        assert np.array_equal(
+            valid_times, times[expected_valid]
+        ), "Valid times mismatch"
+
+
+def test_linear_interpolation_with_phase_shifts_fortran_order_data():
+    with create_sequence_data(
+        n_signals=10, t_end=5.0, sampling_rate=10.0, shifts_per_signal=True
+    ) as (timestamps, data, shift):
+        times = timestamps[1 : DEFAULT_SEQUENCE_LENGTH + 1] + 0.5 / 10.0 + shift.max()
+
+        with closing(
+            Interpolator.create("tests/sequence_data", interpolation_mode="linear")
+        ) as seq_interp:
+            expected = seq_interp.interpolate(times=times)
+
+        np.save("tests/sequence_data/data.npy", np.asfortranarray(data))
+        with closing(
+            Interpolator.create("tests/sequence_data", interpolation_mode="linear")
+        ) as seq_interp:
+            assert seq_interp._data.flags.f_contiguous, "Expected Fortran-order data"
+            interp = seq_interp.interpolate(times=times)
+
+        assert np.allclose(
+            interp, expected
+        ), "Fortran-order data should interpolate like C-order data"
+
+
+@pytest.mark.parametrize("use_mem_mapped", [False, True])
+@pytest.mark.parametrize("dtype", [np.float16, np.float32])
+def test_nearest_neighbor_interpolation_with_phase_shifts_narrow_dtypes(
+    use_mem_mapped, dtype
+):
+    with sequence_data_and_interpolator(
+        data_kwargs=dict(
+            n_signals=10,
+            use_mem_mapped=use_mem_mapped,
+            t_end=5.0,
+            sampling_rate=10.0,
+            shifts_per_signal=True,
+            dtype=dtype,
+        )
+    ) as (timestamps, data, _, seq_interp):
+        assert isinstance(
+            seq_interp, PhaseShiftedSequenceInterpolator
+        ), "Interpolation object is not a PhaseShiftedSequenceInterpolator"
+
+        times = timestamps[1 : DEFAULT_SEQUENCE_LENGTH + 1] + 1e-9
+        interp = seq_interp.interpolate(times=times)
+        assert interp.dtype == dtype, f"Expected {dtype} output, got {interp.dtype}"
+        assert (
+            interp == data[0:DEFAULT_SEQUENCE_LENGTH]
+        ).all(), "Nearest neighbor interpolation does not match expected data"
+
+
 def test_interpolation_mode_not_implemented():
     with sequence_data_and_interpolator() as (_, _, _, seq_interp):
         seq_interp.interpolation_mode = "unsupported_mode"
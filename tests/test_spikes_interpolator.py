@@ -193,3 +193,16 @@ def test_memmap_loading():
 
         flat_gt = np.concatenate(gt_spikes)
         np.testing.assert_allclose(interp.spikes, flat_gt)
+
+
+def test_contains_uses_valid_interval():
+    """
+    SpikeInterpolator has no `timestamps` attribute, so membership must be
+    decided from the valid interval alone.
+    """
+    with spikes_data_and_interpolator(
+        data_kwargs={"duration": 10.0, "n_neurons": 5}
+    ) as (_, interp):
+        assert not hasattr(interp, "timestamps")
+        assert np.array([0.0, 20.0]) in interp
+        assert np.array([-5.0, 20.0]) not in interp